@@ -1,118 +1,430 @@
 import os
+import argparse
+import asyncio
+import hashlib
+import random
+import re
+import tempfile
+import time
+import httpx
+import orjson
 import requests
-from datetime import datetime
-from typing import List, Dict
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, List, Dict, Optional, Tuple, Union
 from dotenv import load_dotenv
 import anthropic
 
 load_dotenv()
 
 
+def parse_json(response: Union[requests.Response, httpx.Response]) -> Any:
+    """Decode a GitHub response body with orjson, which is much faster than
+    the stdlib json on large paginated payloads"""
+    return orjson.loads(response.content)
+
+
+# How many recently updated merged PRs the search lookups compare by merge
+# date; search can only sort by update time
+SEARCH_CANDIDATES = 20
+
+
+def pr_comment_urls(owner: str, repo: str, pr_number: int) -> List[str]:
+    """URLs for a PR's issue comments, review comments and reviews"""
+    base = f"https://api.github.com/repos/{owner}/{repo}"
+    return [
+        # Issue comments (general PR comments)
+        f"{base}/issues/{pr_number}/comments",
+        # Review comments (code-specific comments)
+        f"{base}/pulls/{pr_number}/comments",
+        # PR reviews (overall reviews)
+        f"{base}/pulls/{pr_number}/reviews",
+    ]
+
+
+def merge_pr_comments(
+    issue_comments: List[Dict], review_comments: List[Dict], reviews: List[Dict]
+) -> List[Dict]:
+    """Combine the three PR comment sources into a single list"""
+    comments = [*issue_comments, *review_comments]
+
+    # Add review bodies as comments
+    for review in reviews:
+        if review.get("body"):
+            comments.append(
+                {
+                    "body": review["body"],
+                    "user": review["user"],
+                    "created_at": review.get("submitted_at"),
+                    "type": "review",
+                }
+            )
+
+    return comments
+
+
+# Merge dates of the most recently updated merged PRs in the user's public
+# repos; search can only sort by update time, so the caller picks the latest
+_MERGED_PR_CANDIDATES_QUERY = """
+query($q: String!, $first: Int!) {
+  search(query: $q, type: ISSUE, first: $first) {
+    nodes {
+      ... on PullRequest {
+        number
+        mergedAt
+        repository { name owner { login } }
+      }
+    }
+  }
+}
+"""
+
+# One PR together with everything get_pr_comments() would otherwise need
+# three requests for
+_PULL_REQUEST_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      additions
+      deletions
+      mergedAt
+      url
+      author { login }
+      comments(first: 50) { nodes { author { login } body createdAt } }
+      reviews(first: 20) {
+        nodes {
+          author { login }
+          body
+          submittedAt
+          comments(first: 20) { nodes { author { login } body createdAt } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def graphql_user(node: Dict) -> Dict:
+    """REST-style user object for a GraphQL node (author is null for ghosts)"""
+    return {"login": (node.get("author") or {}).get("login", "ghost")}
+
+
+# Wait at least this long after a secondary rate limit that gives no Retry-After
+SECONDARY_LIMIT_DELAY = 60.0
+# Don't sleep longer than this for a rate limit; fail the request instead
+MAX_RATE_LIMIT_WAIT = 15 * 60.0
+# Start spacing requests out once less than this share of the quota remains
+THROTTLE_BELOW = 0.1
+
+
+def rate_limit_delay(
+    response: Union[requests.Response, httpx.Response], attempt: int
+) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, or None if the
+    response should not be retried"""
+    if response.status_code not in (403, 429):
+        return None
+
+    headers = response.headers
+    if "Retry-After" in headers:
+        return float(headers["Retry-After"])
+    if headers.get("X-RateLimit-Remaining") == "0":
+        # Primary limit exhausted: wait for the window to reset
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is None:
+            return SECONDARY_LIMIT_DELAY
+        return max(0.0, float(reset) - time.time())
+    if "secondary rate limit" in response.text.lower():
+        # GitHub asks for at least a minute, backing off exponentially after
+        return SECONDARY_LIMIT_DELAY * 2**attempt
+    if response.status_code == 429:
+        # Exponential backoff with jitter, capped at 30s
+        return min(30.0, 2.0**attempt) + random.uniform(0, 1)
+
+    # A plain 403 is a permissions problem, not a rate limit
+    return None
+
+
+def throttle_delay(response: Union[requests.Response, httpx.Response]) -> float:
+    """Seconds to space out the next request so the remaining quota lasts until
+    the rate-limit window resets, or 0 while plenty of it remains"""
+    headers = response.headers
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        limit = int(headers["X-RateLimit-Limit"])
+        reset = float(headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return 0.0
+
+    if remaining >= limit * THROTTLE_BELOW:
+        return 0.0
+    return max(0.0, reset - time.time()) / (remaining + 1)
+
+
+class RateLimiter:
+    """A "paused until" deadline shared by all of a client's requests, so one
+    rate-limited response holds back every request rather than just its own"""
+
+    __slots__ = ("paused_until",)
+
+    def __init__(self):
+        self.paused_until = 0.0
+
+    def wait_time(self) -> float:
+        """Seconds left before requests may be sent again"""
+        return self.paused_until - time.monotonic()
+
+    def pause(self, delay: float) -> None:
+        """Hold back requests for delay seconds from now"""
+        paused_until = time.monotonic() + delay
+        if paused_until <= self.paused_until:
+            return
+        if delay >= 10:
+            print(f"  Waiting {delay:.0f}s for GitHub's rate limit...")
+        self.paused_until = paused_until
+
+    def should_retry(
+        self, response: Union[requests.Response, httpx.Response], attempt: int
+    ) -> bool:
+        """Pause as the response's rate-limit headers ask, and return whether
+        the request should be retried once the pause is over"""
+        delay = rate_limit_delay(response, attempt)
+        if delay is None:
+            self.pause(min(throttle_delay(response), MAX_RATE_LIMIT_WAIT))
+            return False
+        if delay > MAX_RATE_LIMIT_WAIT:
+            print(
+                f"  GitHub rate limit resets in {delay / 60:.0f} minutes, not waiting"
+            )
+            return False
+
+        self.pause(delay)
+        return True
+
+
 class GitHubClient:
+    __slots__ = ("token", "session", "rate_limiter")
+
+    MAX_ATTEMPTS = 5
+
+    # Keywords that classify CodeRabbit comment bodies
+    _SUGGESTION_RE = re.compile(r"suggest|recommend|consider|improvement", re.I)
+    _QUALITY_RE = re.compile(r"quality|security|performance|best practice", re.I)
+
     def __init__(self, token: str):
         self.token = token
-        self.session = requests.Session()
+        # Cache responses on disk and revalidate them with GitHub's ETag /
+        # Last-Modified headers; 304s don't count against the rate limit
+        self.session = requests_cache.CachedSession(
+            "gh_cache",
+            backend="sqlite",
+            cache_control=True,
+            expire_after=300,
+            stale_if_error=True,
+            match_headers=["Accept"],
+        )
+        # Keep enough pooled connections for the parallel comment fetches
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3+json",
+                "Accept": "application/vnd.github+json",
             }
         )
-
-    def get_user_repos(self, username: str) -> List[Dict]:
-        """Fetch all public repositories for a user"""
-        repos = []
-        page = 1
-        per_page = 100
-
-        while True:
-            url = f"https://api.github.com/users/{username}/repos"
-            params = {"page": page, "per_page": per_page, "type": "public"}
-
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-
-            page_repos = response.json()
-            if not page_repos:
+        self.rate_limiter = RateLimiter()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying when GitHub rate limits us"""
+        for attempt in range(self.MAX_ATTEMPTS):
+            # The comment fetches share the limiter across threads, so check
+            # again in case another response extended the pause
+            while (wait := self.rate_limiter.wait_time()) > 0:
+                time.sleep(wait)
+
+            response = self.session.request(method, url, **kwargs)
+            if not self.rate_limiter.should_retry(response, attempt):
                 break
 
-            repos.extend(page_repos)
-            page += 1
-
-        return repos
+        response.raise_for_status()
+        return response
 
-    def get_recent_merged_prs(
-        self, owner: str, repo: str, limit: int = 5
-    ) -> List[Dict]:
-        """Get recently merged PRs for a repository"""
-        url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
+    def iter_user_repos(self, username: str) -> Iterator[Tuple[str, str]]:
+        """Yield (owner, name) for a user's public repositories, most recently
+        updated first. Pages are fetched lazily and only these two fields are
+        kept, so the full repository objects are never held all at once."""
+        url = f"https://api.github.com/users/{username}/repos"
         params = {
-            "state": "closed",
+            "per_page": 100,
+            "type": "public",
             "sort": "updated",
             "direction": "desc",
-            "per_page": limit * 2,  # Get more to filter for merged ones
         }
 
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+        while url:
+            response = self._request("GET", url, params=params)
+            for repo in parse_json(response):
+                yield repo["owner"]["login"], repo["name"]
 
-        prs = response.json()
-        merged_prs = [pr for pr in prs if pr.get("merged_at")]
-
-        return merged_prs[:limit]
+            # Follow the Link header; no rel="next" means this was the last page
+            url = response.links.get("next", {}).get("url")
+            params = None
 
     def get_pr_details(self, owner: str, repo: str, pr_number: int) -> Dict:
         """Get detailed information about a specific PR"""
         url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-        response = self.session.get(url, params={"state": "closed"})
-        response.raise_for_status()
-        return response.json()
+        response = self._request("GET", url, params={"state": "closed"})
+        return parse_json(response)
+
+    def find_latest_merged_pr(
+        self, username: str
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """Find the most recently merged PR across a user's public repos via
+        the search API. Returns the full PR and its repo name."""
+        url = "https://api.github.com/search/issues"
+        params = {
+            "q": f"user:{username} is:pr is:merged is:public",
+            "sort": "updated",
+            "order": "desc",
+            "per_page": SEARCH_CANDIDATES,
+        }
 
-    def get_recent_commits(self, owner: str, repo: str, limit: int = 5) -> List[Dict]:
-        """Get recent commits from a repository"""
-        url = f"https://api.github.com/repos/{owner}/{repo}/commits"
-        params = {"per_page": limit, "author": owner}
+        response = self._request("GET", url, params=params)
 
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+        items = parse_json(response)["items"]
+        if not items:
+            return None, None
+
+        # Search can't sort by merge date, and a comment on an old PR bumps
+        # its updated time, so pick the latest merge among the candidates
+        latest = max(items, key=lambda item: item["pull_request"]["merged_at"])
+
+        # repository_url is https://api.github.com/repos/{owner}/{repo};
+        # search results lack the base repo and diff stats, so fetch the PR
+        owner, repo = latest["repository_url"].rsplit("/", 2)[-2:]
+        return self.get_pr_details(owner, repo, latest["number"]), repo
+
+    def find_latest_commit(self, username: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Find the user's most recent commit across their public repos with a
+        single search request. Returns the commit and its repo name."""
+        url = "https://api.github.com/search/commits"
+        params = {
+            "q": f"author:{username} user:{username} is:public",
+            "sort": "author-date",
+            "order": "desc",
+            "per_page": 1,
+        }
+
+        response = self._request("GET", url, params=params)
+
+        items = parse_json(response)["items"]
+        if not items:
+            return None, None
+
+        return items[0], items[0]["repository"]["name"]
+
+    def gql(self, query: str, variables: Dict) -> Dict:
+        """Run a GraphQL v4 query and return its data"""
+        response = self._request(
+            "POST",
+            "https://api.github.com/graphql",
+            json={"query": query, "variables": variables},
+        )
+
+        result = parse_json(response)
+        if result.get("errors"):
+            messages = "; ".join(error["message"] for error in result["errors"])
+            raise RuntimeError(f"GraphQL query failed: {messages}")
+
+        return result["data"]
+
+    def find_latest_merged_pr_graphql(
+        self, username: str
+    ) -> Tuple[Optional[Dict], Optional[str], Optional[List[Dict]]]:
+        """Find the most recently merged PR and its comments with two GraphQL
+        requests. Returns the PR and comments in REST shape."""
+        data = self.gql(
+            _MERGED_PR_CANDIDATES_QUERY,
+            {
+                "q": f"user:{username} is:pr is:merged is:public sort:updated-desc",
+                "first": SEARCH_CANDIDATES,
+            },
+        )
+
+        nodes = data["search"]["nodes"]
+        if not nodes:
+            return None, None, None
+
+        latest = max(nodes, key=lambda node: node["mergedAt"])
+        repository = latest["repository"]
+        data = self.gql(
+            _PULL_REQUEST_QUERY,
+            {
+                "owner": repository["owner"]["login"],
+                "name": repository["name"],
+                "number": latest["number"],
+            },
+        )
 
-        return response.json()
+        node = data["repository"]["pullRequest"]
+        pr = {
+            "number": node["number"],
+            "title": node["title"],
+            "body": node["body"],
+            "additions": node["additions"],
+            "deletions": node["deletions"],
+            "merged_at": node["mergedAt"],
+            "html_url": node["url"],
+            "user": graphql_user(node),
+            "base": {
+                "repo": {
+                    "name": repository["name"],
+                    "owner": repository["owner"],
+                }
+            },
+        }
+
+        reviews = node["reviews"]["nodes"]
+        issue_comments = [
+            {"body": c["body"], "user": graphql_user(c), "created_at": c["createdAt"]}
+            for c in node["comments"]["nodes"]
+        ]
+        review_comments = [
+            {"body": c["body"], "user": graphql_user(c), "created_at": c["createdAt"]}
+            for review in reviews
+            for c in review["comments"]["nodes"]
+        ]
+        reviews = [
+            {
+                "body": r["body"],
+                "user": graphql_user(r),
+                "submitted_at": r["submittedAt"],
+            }
+            for r in reviews
+        ]
+
+        comments = merge_pr_comments(issue_comments, review_comments, reviews)
+        return pr, repository["name"], comments
 
     def get_pr_comments(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """Get all comments for a specific PR"""
-        comments = []
+        urls = pr_comment_urls(owner, repo, pr_number)
 
-        # Get issue comments (general PR comments)
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}/comments"
-        response = self.session.get(url)
-        response.raise_for_status()
-        comments.extend(response.json())
+        def fetch(url: str) -> List[Dict]:
+            return parse_json(self._request("GET", url))
 
-        # Get review comments (code-specific comments)
-        url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/comments"
-        response = self.session.get(url)
-        response.raise_for_status()
-        comments.extend(response.json())
+        # The three endpoints are independent, so fetch them in parallel
+        # over the shared session's connection pool
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            issue_comments, review_comments, reviews = executor.map(fetch, urls)
 
-        # Get PR reviews (overall reviews)
-        url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-        response = self.session.get(url)
-        response.raise_for_status()
-        reviews = response.json()
-
-        # Add review bodies as comments
-        for review in reviews:
-            if review.get("body"):
-                comments.append(
-                    {
-                        "body": review["body"],
-                        "user": review["user"],
-                        "created_at": review.get("submitted_at"),
-                        "type": "review",
-                    }
-                )
-
-        return comments
+        return merge_pr_comments(issue_comments, review_comments, reviews)
 
     def extract_coderabbit_insights(self, comments: List[Dict]) -> Dict:
         """Extract CodeRabbit insights from PR comments"""
@@ -125,69 +437,222 @@ class GitHubClient:
 
         for comment in comments:
             user_login = comment.get("user", {}).get("login", "").lower()
+
+            # Only CodeRabbit comments carry insights ("coderabbit" also
+            # matches "coderabbitai")
+            if "coderabbit" not in user_login:
+                continue
+
             body = comment.get("body", "")
 
-            # Check if this is a CodeRabbit comment
-            if "coderabbitai" in user_login or "coderabbit" in user_login:
-                # Extract summary (usually in first comment)
-                if "## Summary" in body or "**Summary**" in body:
-                    coderabbit_data["summary"] = body
+            # Extract summary (usually in first comment)
+            if "## Summary" in body or "**Summary**" in body:
+                coderabbit_data["summary"] = body
 
-                # Extract key changes
-                if "## Changes" in body or "**Changes**" in body:
-                    coderabbit_data["key_changes"].append(body)
+            # Extract key changes
+            if "## Changes" in body or "**Changes**" in body:
+                coderabbit_data["key_changes"].append(body)
 
-                # Extract suggestions/recommendations
-                if any(
-                    keyword in body.lower()
-                    for keyword in ["suggest", "recommend", "consider", "improvement"]
-                ):
-                    coderabbit_data["suggestions"].append(body)
-
-                # Extract quality insights
-                if any(
-                    keyword in body.lower()
-                    for keyword in [
-                        "quality",
-                        "security",
-                        "performance",
-                        "best practice",
-                    ]
-                ):
-                    coderabbit_data["quality_insights"].append(body)
+            # Extract suggestions/recommendations
+            if self._SUGGESTION_RE.search(body):
+                coderabbit_data["suggestions"].append(body)
+
+            # Extract quality insights
+            if self._QUALITY_RE.search(body):
+                coderabbit_data["quality_insights"].append(body)
 
         return coderabbit_data
 
 
-class ContentGenerator:
-    def __init__(self, anthropic_api_key: str):
-        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+class AsyncGitHubClient:
+    """Async GitHub client for the per-repository scan, which fans out one
+    request per repository concurrently"""
 
-    def generate_linkedin_post(
-        self, pr_data: Dict, repo_name: str, coderabbit_insights: Dict = None
-    ) -> str:
-        """Generate a LinkedIn post about a merged PR"""
-        coderabbit_context = ""
-        if coderabbit_insights and any(coderabbit_insights.values()):
-            coderabbit_context = "\n\nCodeRabbit AI Review Insights:"
-            if coderabbit_insights.get("summary"):
-                coderabbit_context += (
-                    f"\n- Summary: {coderabbit_insights['summary'][:200]}..."
-                )
-            if coderabbit_insights.get("suggestions"):
-                coderabbit_context += f"\n- Key suggestions: {len(coderabbit_insights['suggestions'])} improvements identified"
-            if coderabbit_insights.get("quality_insights"):
-                coderabbit_context += f"\n- Quality insights: {len(coderabbit_insights['quality_insights'])} quality improvements noted"
+    __slots__ = ("token", "client", "_semaphore", "rate_limiter")
+
+    MAX_CONCURRENT_REQUESTS = 10
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, token: str, rate_limiter: Optional[RateLimiter] = None):
+        self.token = token
+        self.client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            # HTTP/2 multiplexes the concurrent scan over one TLS connection
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=10.0,
+        )
+        # Cap in-flight requests so a wide scan doesn't trip GitHub's
+        # secondary (abuse) rate limits
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Pass the sync client's limiter to honour a pause it already hit
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        """GET with bounded concurrency, retrying when GitHub rate limits us"""
+        for attempt in range(self.MAX_ATTEMPTS):
+            # Every request checks the shared pause before taking a slot, so
+            # one rate-limited response holds back the whole scan
+            while (wait := self.rate_limiter.wait_time()) > 0:
+                await asyncio.sleep(wait)
+            async with self._semaphore:
+                response = await self.client.get(url, params=params)
+
+            if not self.rate_limiter.should_retry(response, attempt):
+                break
+
+        response.raise_for_status()
+        return response
+
+    async def get_recent_merged_prs(
+        self, owner: str, repo: str, limit: int = 5
+    ) -> List[Dict]:
+        """Get recently merged PRs for a repository"""
+        url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
+        params = {
+            "state": "closed",
+            "sort": "updated",
+            "direction": "desc",
+            # REST can't filter on merged, so over-fetch to leave room for
+            # closed-but-unmerged PRs and keep this to one request per repo.
+            # The server-side filter is the is:merged search main() tries
+            # first; this scan only runs when that finds nothing
+            "per_page": limit * 2,
+        }
+
+        response = await self._get(url, params)
+
+        merged_prs = [pr for pr in parse_json(response) if pr.get("merged_at")]
+        return merged_prs[:limit]
+
+    async def get_recent_commits(
+        self, owner: str, repo: str, limit: int = 5
+    ) -> List[Dict]:
+        """Get recent commits from a repository"""
+        url = f"https://api.github.com/repos/{owner}/{repo}/commits"
+        params = {"per_page": limit, "author": owner}
+
+        response = await self._get(url, params)
+
+        return parse_json(response)
+
+
+async def scan_merged_prs(
+    token: str,
+    repos: List[Tuple[str, str]],
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Tuple[Optional[Dict], Optional[datetime], Optional[str]]:
+    """Find the most recently merged PR across (owner, name) repos, querying
+    them concurrently"""
+    async with AsyncGitHubClient(token, rate_limiter) as client:
+        results = await asyncio.gather(
+            *(
+                client.get_recent_merged_prs(owner, repo_name, 5)
+                for owner, repo_name in repos
+            ),
+            return_exceptions=True,
+        )
+
+    most_recent_pr = None
+    most_recent_repo = None
+
+    for (_, repo_name), merged_prs in zip(repos, results):
+        print(f"Checking {repo_name} for recent PRs...")
+        if isinstance(merged_prs, httpx.HTTPError):
+            print(f"  Error checking {repo_name}: {merged_prs}")
+            continue
+        if isinstance(merged_prs, BaseException):
+            raise merged_prs
+
+        if merged_prs:
+            print(f"  Found {len(merged_prs)} merged PR(s) in {repo_name}")
+            for i, pr in enumerate(merged_prs):
+                # GitHub timestamps are fixed-width UTC ("YYYY-MM-DDTHH:MM:SSZ"),
+                # so they compare correctly as strings without parsing
+                print(f"    {i + 1}. '{pr['title']}' merged on {pr['merged_at'][:10]}")
+
+                if (
+                    most_recent_pr is None
+                    or pr["merged_at"] > most_recent_pr["merged_at"]
+                ):
+                    most_recent_pr = pr
+                    most_recent_repo = repo_name
+        else:
+            print(f"  No merged PRs found in {repo_name}")
+
+    if most_recent_pr is None:
+        return None, None, None
+
+    most_recent_date = datetime.fromisoformat(most_recent_pr["merged_at"])
+    return most_recent_pr, most_recent_date, most_recent_repo
+
+
+async def scan_recent_commits(
+    token: str,
+    repos: List[Tuple[str, str]],
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Tuple[Optional[Dict], Optional[datetime], Optional[str]]:
+    """Find the most recent commit across (owner, name) repos, querying them
+    concurrently"""
+    async with AsyncGitHubClient(token, rate_limiter) as client:
+        results = await asyncio.gather(
+            *(
+                client.get_recent_commits(owner, repo_name, 3)
+                for owner, repo_name in repos
+            ),
+            return_exceptions=True,
+        )
+
+    most_recent_commit = None
+    most_recent_commit_repo = None
 
-        prompt = f"""
+    for (_, repo_name), commits in zip(repos, results):
+        if isinstance(commits, httpx.HTTPError):
+            continue
+        if isinstance(commits, BaseException):
+            raise commits
+
+        for commit in commits:
+            # Fixed-width UTC timestamps compare correctly as strings
+            if (
+                most_recent_commit is None
+                or commit["commit"]["author"]["date"]
+                > most_recent_commit["commit"]["author"]["date"]
+            ):
+                most_recent_commit = commit
+                most_recent_commit_repo = repo_name
+
+    if most_recent_commit is None:
+        return None, None, None
+
+    most_recent_commit_date = datetime.fromisoformat(
+        most_recent_commit["commit"]["author"]["date"]
+    )
+    return most_recent_commit, most_recent_commit_date, most_recent_commit_repo
+
+
+# Generation prompts, filled in with str.format_map
+_LINKEDIN_PR_TMPL = """
 Create a professional LinkedIn post about this merged pull request. 
 Make it engaging and highlight the technical achievement without being too technical for a general audience.
 
 Repository: {repo_name}
-PR Title: {pr_data["title"]}
-PR Description: {pr_data.get("body", "No description provided")}
-Author: {pr_data["user"]["login"]}
-Changes: {pr_data.get("additions", 0)} additions, {pr_data.get("deletions", 0)} deletions{coderabbit_context}
+PR Title: {title}
+PR Description: {body}
+Author: {author}
+Changes: {additions} additions, {deletions} deletions{coderabbit_context}
 
 Make the post:
 - Professional but approachable
@@ -198,36 +663,14 @@ Make the post:
 - Don't use overly technical jargon
 """
 
-        response = self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        return response.content[0].text.strip()
-
-    def generate_tweet(
-        self, pr_data: Dict, repo_name: str, coderabbit_insights: Dict = None
-    ) -> str:
-        """Generate a Twitter thread about a merged PR"""
-        coderabbit_context = ""
-        if coderabbit_insights and any(coderabbit_insights.values()):
-            insights_count = sum(
-                len(v) if isinstance(v, list) else (1 if v else 0)
-                for v in coderabbit_insights.values()
-            )
-            coderabbit_context = (
-                f"\nAI-reviewed with {insights_count} insights from CodeRabbit"
-            )
-
-        prompt = f"""
+_TWEET_PR_TMPL = """
 Create a concise Twitter post (under 280 characters) about this merged pull request.
 Make it engaging and use relevant hashtags.
 
 Repository: {repo_name}
-PR Title: {pr_data["title"]}
-PR Description: {pr_data.get("body", "No description provided")}
-Author: {pr_data["user"]["login"]}{coderabbit_context}
+PR Title: {title}
+PR Description: {body}
+Author: {author}{coderabbit_context}
 
 Make the tweet:
 - Concise and engaging
@@ -237,21 +680,7 @@ Make the tweet:
 - Stay under 280 characters
 """
 
-        response = self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=200,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        return response.content[0].text.strip()
-
-    def generate_commit_linkedin_post(self, commit_data: Dict, repo_name: str) -> str:
-        """Generate a LinkedIn post about a recent commit"""
-        commit_message = commit_data["commit"]["message"]
-        commit_sha = commit_data["sha"][:7]
-        author = commit_data["commit"]["author"]["name"]
-
-        prompt = f"""
+_LINKEDIN_COMMIT_TMPL = """
 Create a professional LinkedIn post about this recent code commit.
 Make it engaging and highlight the development progress without being too technical.
 
@@ -268,20 +697,7 @@ Make the post:
 - Focus on the value/impact rather than technical details
 """
 
-        response = self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        return response.content[0].text.strip()
-
-    def generate_commit_tweet(self, commit_data: Dict, repo_name: str) -> str:
-        """Generate a Twitter post about a recent commit"""
-        commit_message = commit_data["commit"]["message"]
-        commit_sha = commit_data["sha"][:7]
-
-        prompt = f"""
+_TWEET_COMMIT_TMPL = """
 Create a concise Twitter post (under 280 characters) about this recent code commit.
 Make it engaging and use relevant hashtags.
 
@@ -297,16 +713,160 @@ Make the tweet:
 - Use an enthusiastic but professional tone
 """
 
+DEFAULT_LLM_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "twitter-linkedin-poster"
+)
+
+
+class ContentGenerator:
+    __slots__ = ("client", "cache_dir", "refresh")
+
+    MODEL = "claude-3-5-sonnet-20241022"
+
+    def __init__(
+        self,
+        anthropic_api_key: str,
+        cache_dir: Path = DEFAULT_LLM_CACHE_DIR,
+        refresh: bool = False,
+    ):
+        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+        # Generated posts are cached on disk by prompt hash so reruns are
+        # instant; refresh skips the lookup but still stores the new result
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """Run a prompt against Claude, reusing a cached result when available"""
+        key = hashlib.blake2b(
+            "\0".join([self.MODEL, str(max_tokens), prompt]).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_file = self.cache_dir / f"{key}.txt"
+
+        if not self.refresh and cache_file.exists():
+            return cache_file.read_text(encoding="utf-8")
+
         response = self.client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=200,
+            model=self.MODEL,
+            max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        return response.content[0].text.strip()
+        text = response.content[0].text.strip()
+        try:
+            self._store(cache_file, text)
+        except (OSError, UnicodeError) as e:
+            # The cache is only an optimisation; never lose a paid-for post to it
+            print(f"  Could not cache generated post: {e}")
+        return text
+
+    def _store(self, cache_file: Path, text: str) -> None:
+        """Write a cache entry via a temp file renamed into place, so an
+        interrupted or concurrent run never leaves a truncated post behind"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(text)
+            os.replace(tmp_path, cache_file)
+        finally:
+            # Only still there if the rename never happened
+            Path(tmp_path).unlink(missing_ok=True)
+
+    def generate_linkedin_post(
+        self, pr_data: Dict, repo_name: str, coderabbit_insights: Dict = None
+    ) -> str:
+        """Generate a LinkedIn post about a merged PR"""
+        coderabbit_context = ""
+        if coderabbit_insights and any(coderabbit_insights.values()):
+            coderabbit_context = "\n\nCodeRabbit AI Review Insights:"
+            if coderabbit_insights.get("summary"):
+                coderabbit_context += (
+                    f"\n- Summary: {coderabbit_insights['summary'][:200]}..."
+                )
+            if coderabbit_insights.get("suggestions"):
+                coderabbit_context += f"\n- Key suggestions: {len(coderabbit_insights['suggestions'])} improvements identified"
+            if coderabbit_insights.get("quality_insights"):
+                coderabbit_context += f"\n- Quality insights: {len(coderabbit_insights['quality_insights'])} quality improvements noted"
+
+        prompt = _LINKEDIN_PR_TMPL.format_map(
+            {
+                "repo_name": repo_name,
+                "title": pr_data["title"],
+                "body": pr_data.get("body") or "No description provided",
+                "author": pr_data["user"]["login"],
+                "additions": pr_data.get("additions", 0),
+                "deletions": pr_data.get("deletions", 0),
+                "coderabbit_context": coderabbit_context,
+            }
+        )
+
+        return self._complete(prompt, max_tokens=500)
+
+    def generate_tweet(
+        self, pr_data: Dict, repo_name: str, coderabbit_insights: Dict = None
+    ) -> str:
+        """Generate a Twitter thread about a merged PR"""
+        coderabbit_context = ""
+        if coderabbit_insights and any(coderabbit_insights.values()):
+            insights_count = sum(
+                len(v) if isinstance(v, list) else (1 if v else 0)
+                for v in coderabbit_insights.values()
+            )
+            coderabbit_context = (
+                f"\nAI-reviewed with {insights_count} insights from CodeRabbit"
+            )
+
+        prompt = _TWEET_PR_TMPL.format_map(
+            {
+                "repo_name": repo_name,
+                "title": pr_data["title"],
+                "body": pr_data.get("body") or "No description provided",
+                "author": pr_data["user"]["login"],
+                "coderabbit_context": coderabbit_context,
+            }
+        )
+
+        return self._complete(prompt, max_tokens=200)
+
+    def generate_commit_linkedin_post(self, commit_data: Dict, repo_name: str) -> str:
+        """Generate a LinkedIn post about a recent commit"""
+        prompt = _LINKEDIN_COMMIT_TMPL.format_map(
+            {
+                "repo_name": repo_name,
+                "commit_message": commit_data["commit"]["message"],
+                "commit_sha": commit_data["sha"][:7],
+                "author": commit_data["commit"]["author"]["name"],
+            }
+        )
+
+        return self._complete(prompt, max_tokens=500)
+
+    def generate_commit_tweet(self, commit_data: Dict, repo_name: str) -> str:
+        """Generate a Twitter post about a recent commit"""
+        prompt = _TWEET_COMMIT_TMPL.format_map(
+            {
+                "repo_name": repo_name,
+                "commit_message": commit_data["commit"]["message"],
+                "commit_sha": commit_data["sha"][:7],
+            }
+        )
+
+        return self._complete(prompt, max_tokens=200)
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generate LinkedIn and Twitter posts from your latest GitHub work"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate posts instead of reusing cached Claude responses",
+    )
+    args = parser.parse_args()
+
     github_token = os.getenv("GITHUB_TOKEN")
     anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
     github_username = os.getenv("GITHUB_USERNAME")
@@ -321,81 +881,62 @@ def main():
     try:
         # Initialize clients
         github_client = GitHubClient(github_token)
-        content_generator = ContentGenerator(anthropic_api_key)
-
-        # Get user repositories
-        print(f"Fetching repositories for {github_username}...")
-        repos = github_client.get_user_repos(github_username)
-        print(f"Found {len(repos)} public repositories")
-
-        # Find the most recent merged PR across all repos
-        most_recent_pr = None
-        most_recent_date = None
-        most_recent_repo = None
-
-        for repo in repos:
-            repo_name = repo["name"]
-            owner = repo["owner"]["login"]
+        content_generator = ContentGenerator(anthropic_api_key, refresh=args.force)
 
-            print(f"Checking {repo_name} for recent PRs...")
+        # Ask GraphQL first: two requests for the PR and all of its comments,
+        # instead of one per repository plus three for the comments
+        print(f"Searching for the most recent merged PR by {github_username}...")
+        most_recent_pr, most_recent_repo, pr_comments = None, None, None
+        try:
+            most_recent_pr, most_recent_repo, pr_comments = (
+                github_client.find_latest_merged_pr_graphql(github_username)
+            )
+        except (requests.exceptions.RequestException, RuntimeError) as e:
+            print(f"  GraphQL lookup failed, falling back to REST search: {e}")
             try:
-                merged_prs = github_client.get_recent_merged_prs(
-                    owner, repo_name, limit=5
+                most_recent_pr, most_recent_repo = github_client.find_latest_merged_pr(
+                    github_username
                 )
-
-                if merged_prs:
-                    print(f"  Found {len(merged_prs)} merged PR(s) in {repo_name}")
-                    for i, pr in enumerate(merged_prs):
-                        merged_date = datetime.fromisoformat(
-                            pr["merged_at"].replace("Z", "+00:00")
-                        )
-                        print(
-                            f"    {i + 1}. '{pr['title']}' merged on {merged_date.strftime('%Y-%m-%d')}"
-                        )
-
-                        if most_recent_date is None or merged_date > most_recent_date:
-                            most_recent_pr = pr
-                            most_recent_date = merged_date
-                            most_recent_repo = repo_name
-                else:
-                    print(f"  No merged PRs found in {repo_name}")
             except requests.exceptions.RequestException as e:
-                print(f"  Error checking {repo_name}: {e}")
-                continue
+                print(f"  Search failed, scanning repositories instead: {e}")
+
+        if most_recent_pr:
+            most_recent_date = datetime.fromisoformat(most_recent_pr["merged_at"])
+        else:
+            # Get user repositories
+            print(f"Fetching repositories for {github_username}...")
+            repos = list(github_client.iter_user_repos(github_username))
+            print(f"Found {len(repos)} public repositories")
+
+            # Find the most recent merged PR across all repos
+            most_recent_pr, most_recent_date, most_recent_repo = asyncio.run(
+                scan_merged_prs(github_token, repos, github_client.rate_limiter)
+            )
 
         if not most_recent_pr:
             print("\nNo recent merged PRs found. Looking for recent commits instead...")
 
-            # Fallback to recent commits
-            most_recent_commit = None
-            most_recent_commit_date = None
-            most_recent_commit_repo = None
-
-            for repo in repos:
-                repo_name = repo["name"]
-                owner = repo["owner"]["login"]
-
-                try:
-                    commits = github_client.get_recent_commits(
-                        owner, repo_name, limit=3
-                    )
-                    if commits:
-                        for commit in commits:
-                            commit_date = datetime.fromisoformat(
-                                commit["commit"]["author"]["date"].replace(
-                                    "Z", "+00:00"
-                                )
-                            )
-
-                            if (
-                                most_recent_commit_date is None
-                                or commit_date > most_recent_commit_date
-                            ):
-                                most_recent_commit = commit
-                                most_recent_commit_date = commit_date
-                                most_recent_commit_repo = repo_name
-                except requests.exceptions.RequestException:
-                    continue
+            # Fallback to recent commits, again trying the search API first
+            try:
+                most_recent_commit, most_recent_commit_repo = (
+                    github_client.find_latest_commit(github_username)
+                )
+            except requests.exceptions.RequestException as e:
+                print(f"  Search failed, scanning repositories instead: {e}")
+                most_recent_commit, most_recent_commit_repo = None, None
+
+            if most_recent_commit:
+                most_recent_commit_date = datetime.fromisoformat(
+                    most_recent_commit["commit"]["author"]["date"]
+                )
+            else:
+                (
+                    most_recent_commit,
+                    most_recent_commit_date,
+                    most_recent_commit_repo,
+                ) = asyncio.run(
+                    scan_recent_commits(github_token, repos, github_client.rate_limiter)
+                )
 
             if not most_recent_commit:
                 print("No recent commits found either.")
@@ -403,20 +944,27 @@ def main():
 
             print(f"\nMost recent commit found in {most_recent_commit_repo}:")
             print(f"Message: {most_recent_commit['commit']['message']}")
-            print(f"Date: {most_recent_commit_date.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            # Search results carry the committer's UTC offset; normalize first
+            commit_date_utc = most_recent_commit_date.astimezone(timezone.utc)
+            print(f"Date: {commit_date_utc.strftime('%Y-%m-%d %H:%M:%S UTC')}")
             print(f"SHA: {most_recent_commit['sha'][:7]}")
             print(f"URL: {most_recent_commit['html_url']}")
 
-            # Generate content for commit
-            print("\nGenerating LinkedIn post...")
-            linkedin_post = content_generator.generate_commit_linkedin_post(
-                most_recent_commit, most_recent_commit_repo
-            )
-
-            print("\nGenerating Twitter post...")
-            twitter_post = content_generator.generate_commit_tweet(
-                most_recent_commit, most_recent_commit_repo
-            )
+            # Generate content for commit; the two API calls are independent
+            print("\nGenerating LinkedIn and Twitter posts...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                linkedin_future = executor.submit(
+                    content_generator.generate_commit_linkedin_post,
+                    most_recent_commit,
+                    most_recent_commit_repo,
+                )
+                twitter_future = executor.submit(
+                    content_generator.generate_commit_tweet,
+                    most_recent_commit,
+                    most_recent_commit_repo,
+                )
+                linkedin_post = linkedin_future.result()
+                twitter_post = twitter_future.result()
 
             # Display results
             print("\n" + "=" * 60)
@@ -435,7 +983,8 @@ def main():
 
         print(f"\nMost recent PR found in {most_recent_repo}:")
         print(f"Title: {most_recent_pr['title']}")
-        print(f"Merged: {most_recent_date.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        merged_date_utc = most_recent_date.astimezone(timezone.utc)
+        print(f"Merged: {merged_date_utc.strftime('%Y-%m-%d %H:%M:%S UTC')}")
         print(f"URL: {most_recent_pr['html_url']}")
 
         # Fetch CodeRabbit insights from PR comments
@@ -444,9 +993,10 @@ def main():
         owner = most_recent_pr["base"]["repo"]["owner"]["login"]
 
         try:
-            pr_comments = github_client.get_pr_comments(
-                owner, most_recent_repo, pr_number
-            )
+            if pr_comments is None:
+                pr_comments = github_client.get_pr_comments(
+                    owner, most_recent_repo, pr_number
+                )
             coderabbit_insights = github_client.extract_coderabbit_insights(pr_comments)
 
             if any(coderabbit_insights.values()):
@@ -460,16 +1010,23 @@ def main():
             print(f"Error fetching PR comments: {e}")
             coderabbit_insights = None
 
-        # Generate content
-        print("\nGenerating LinkedIn post...")
-        linkedin_post = content_generator.generate_linkedin_post(
-            most_recent_pr, most_recent_repo, coderabbit_insights
-        )
-
-        print("\nGenerating Twitter post...")
-        twitter_post = content_generator.generate_tweet(
-            most_recent_pr, most_recent_repo, coderabbit_insights
-        )
+        # Generate content; the two API calls are independent
+        print("\nGenerating LinkedIn and Twitter posts...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            linkedin_future = executor.submit(
+                content_generator.generate_linkedin_post,
+                most_recent_pr,
+                most_recent_repo,
+                coderabbit_insights,
+            )
+            twitter_future = executor.submit(
+                content_generator.generate_tweet,
+                most_recent_pr,
+                most_recent_repo,
+                coderabbit_insights,
+            )
+            linkedin_post = linkedin_future.result()
+            twitter_post = twitter_future.result()
 
         # Display results
         print("\n" + "=" * 60)